@@ -1,14 +1,31 @@
 #!/usr/bin/env python
-import yaml
-import hashlib
-import random
+import atexit
+import json
+import os
+import queue
+import tempfile
+import threading
 import re
+import yaml
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timedelta
+import numpy as np
+import xxhash
 import mysql.connector
 from mysql.connector import Error
+from mysql.connector import pooling
 import logging
 from typing import Dict, List, Any, Tuple, Optional, Union
 
+# Numba è opzionale: se presente, il loop di offuscamento testo su payload
+# ASCII viene compilato JIT; altrimenti si usa il percorso Python puro
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Configurazione logging
 logging.basicConfig(
     level=logging.INFO,
@@ -17,6 +34,68 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Tabelle per il percorso ASCII JIT: classificazione byte -> categoria
+# (0 = non alfanumerico, 1 = minuscola, 2 = maiuscola, 3 = cifra)
+# e alfabeti di sostituzione per ciascuna categoria
+_CLASS = np.zeros(256, dtype=np.uint8)
+_CLASS[ord('a'):ord('z') + 1] = 1
+_CLASS[ord('A'):ord('Z') + 1] = 2
+_CLASS[ord('0'):ord('9') + 1] = 3
+
+_ALPHABETS = np.zeros((4, 26), dtype=np.uint8)
+_ALPHABETS[1, :26] = np.frombuffer(b'abcdefghijklmnopqrstuvwxyz', dtype=np.uint8)
+_ALPHABETS[2, :26] = np.frombuffer(b'ABCDEFGHIJKLMNOPQRSTUVWXYZ', dtype=np.uint8)
+_ALPHABETS[3, :10] = np.frombuffer(b'0123456789', dtype=np.uint8)
+_SPANS = np.array([1, 26, 26, 10], dtype=np.uint64)
+
+# Parser YAML in C (libyaml) quando disponibile: ~10x più veloce del
+# parser Python puro di PyYAML
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Clausole di indice secondario in una SHOW CREATE TABLE (la PRIMARY KEY
+# viene mantenuta: serve comunque al bulk load ordinato)
+_INDEX_CLAUSE_RE = re.compile(r'^(UNIQUE KEY|FULLTEXT KEY|SPATIAL KEY|KEY)\s')
+
+# Alfabeti e costanti LCG per il fallback Python puro di obfuscate_text:
+# un passo di LCG a 64 bit (1 mul + 1 add) sostituisce il costosissimo
+# random.seed (reseed Mersenne Twister) + random.choice per carattere
+_LOWERCASE = 'abcdefghijklmnopqrstuvwxyz'
+_UPPERCASE = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+_DIGITS = '0123456789'
+_MASK64 = (1 << 64) - 1
+_LCG_MUL = 6364136223846793005
+_LCG_ADD = 1442695040888963407
+
+
+def _obf_ascii_impl(buf: np.ndarray, out: np.ndarray, seed: int) -> None:
+    """
+    Offusca in-place un buffer di byte ASCII: per ogni byte alfanumerico
+    sceglie un sostituto della stessa categoria tramite un RNG xorshift64
+    inline seminato con l'hash del valore; gli altri byte sono preservati.
+
+    Compilata JIT con Numba quando disponibile: elimina i dispatch
+    dell'interprete (isalnum/islower/random.choice) per carattere.
+    """
+    state = np.uint64(seed)
+    if state == np.uint64(0):
+        state = np.uint64(0x9E3779B97F4A7C15)
+    for i in range(buf.shape[0]):
+        c = buf[i]
+        cls = _CLASS[c]
+        if cls == 0:
+            out[i] = c
+        else:
+            state ^= state << np.uint64(13)
+            state ^= state >> np.uint64(7)
+            state ^= state << np.uint64(17)
+            out[i] = _ALPHABETS[cls, (state >> np.uint64(17)) % _SPANS[cls]]
+
+
+if NUMBA_AVAILABLE:
+    _obf_ascii = njit(cache=True)(_obf_ascii_impl)
+else:
+    _obf_ascii = _obf_ascii_impl
+
 class DbObfuscator:
     def __init__(self, config_file: str, fields_file: str):
         """
@@ -26,15 +105,58 @@ class DbObfuscator:
             config_file: Path del file di configurazione YAML
             fields_file: Path del file con i campi da offuscare
         """
+        # I path vengono conservati per poter ricreare l'istanza nei worker
+        # di processo (vedi _process_table_worker)
+        self.config_file = config_file
+        self.fields_file = fields_file
         self.config = self._load_config(config_file)
         self.fields_to_obfuscate = self._load_fields(fields_file)
         self.source_conn = None
         self.dest_conn = None
         
-        # Dizionario per assicurare consistenza nell'offuscamento
-        self.text_cache = {}
-        self.date_shift_cache = {}
-        self.number_factor_cache = {}
+        # Cache per assicurare consistenza nell'offuscamento.
+        # Chiave = hash a 64 bit del valore (8 byte, confronto O(1)) invece
+        # della stringa originale; dimensione limitata con eviction FIFO per
+        # non accumulare memoria illimitata su tabelle con molti valori unici
+        self.cache_max_entries = 1_000_000
+        self.text_cache = OrderedDict()
+        self.date_shift_cache = OrderedDict()
+        self.number_factor_cache = OrderedDict()
+
+        # Cache dei risultati finali per date e numeri, con chiave
+        # (tipo, valore): sulla ripetizione evita anche str() e hash
+        self._date_result_cache = OrderedDict()
+        self._number_result_cache = OrderedDict()
+
+        # Cache degli hash pre-calcolati in blocco per il batch corrente
+        self._batch_hash_cache = {}
+
+        # Cache della struttura delle tabelle: un solo DESCRIBE/SHOW CREATE
+        # per tabella invece di uno per ogni campo interrogato
+        self._structure_cache = {}
+
+        # Schema delle tabelle da offuscare, caricato in un'unica query su
+        # information_schema alla connessione: {tabella: {colonna: tipo}}
+        self._schema = {}
+
+        # Inserimento bulk via LOAD DATA LOCAL INFILE (un solo messaggio di
+        # protocollo per batch invece di un round-trip per riga); se il server
+        # non lo consente si ripiega automaticamente su executemany
+        self._use_load_data = bool(self.config.get('use_load_data', True))
+
+        # Budget in byte per singola INSERT multi-VALUES: prudentemente sotto
+        # il max_allowed_packet di default di MySQL (4 MB) con 1 MB di margine
+        self._max_statement_bytes = 3 * 1024 * 1024
+
+        # Cursore preparato (protocollo binario) per gli INSERT di fallback,
+        # creato pigramente sulla connessione di destinazione
+        self._dest_prepared_cursor = None
+
+        # Con parallel_inserts > 1 gli INSERT di una stessa tabella vengono
+        # distribuiti su un pool di connessioni di destinazione (il protocollo
+        # MySQL è half-duplex: una connessione sola satura prima del server)
+        self.parallel_inserts = int(self.config.get('parallel_inserts', 1))
+        self._dest_pool = None
         
         # Mappatura tipi MySQL → categoria offuscamento
         self.type_mapping = {
@@ -51,7 +173,7 @@ class DbObfuscator:
         """Carica la configurazione dal file YAML"""
         try:
             with open(config_file, 'r') as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=_YAML_LOADER)
         except Exception as e:
             logger.error(f"Errore nel caricamento del file di configurazione: {e}")
             raise
@@ -64,6 +186,16 @@ class DbObfuscator:
         Returns:
             Dict[str, List[str]]: Dizionario con chiave=tabella, valore=lista di campi
         """
+        # Cache JSON a lato del file di testo, invalidata dall'mtime:
+        # salta il parsing riga per riga nelle esecuzioni successive
+        cache_file = fields_file + '.json'
+        try:
+            if os.path.getmtime(cache_file) >= os.path.getmtime(fields_file):
+                with open(cache_file, 'r') as f:
+                    return json.load(f)
+        except (OSError, ValueError):
+            pass
+
         fields_dict = {}
         try:
             with open(fields_file, 'r') as f:
@@ -85,7 +217,14 @@ class DbObfuscator:
                         fields_dict[table] = []
                     
                     fields_dict[table].append(field)
-            
+
+            # Aggiorna la cache (best effort: un fallimento non è bloccante)
+            try:
+                with open(cache_file, 'w') as f:
+                    json.dump(fields_dict, f)
+            except OSError as e:
+                logger.warning(f"Impossibile scrivere la cache dei campi {cache_file}: {e}")
+
             return fields_dict
         except Exception as e:
             logger.error(f"Errore nel caricamento del file dei campi: {e}")
@@ -104,14 +243,32 @@ class DbObfuscator:
             logger.info(f"Connesso al DB sorgente: {self.config['source']['database']}")
             
             # Connessione al database destinazione
+            # (allow_local_infile abilita il bulk load via LOAD DATA LOCAL INFILE)
             self.dest_conn = mysql.connector.connect(
                 host=self.config['destination']['host'],
                 user=self.config['destination']['user'],
                 password=self.config['destination']['password'],
-                database=self.config['destination']['database']
+                database=self.config['destination']['database'],
+                allow_local_infile=True
             )
             logger.info(f"Connesso al DB destinazione: {self.config['destination']['database']}")
 
+            # Pool di connessioni per gli inserimenti paralleli intra-tabella
+            if self.parallel_inserts > 1:
+                self._dest_pool = pooling.MySQLConnectionPool(
+                    pool_name=f"dest_pool_{os.getpid()}",
+                    pool_size=self.parallel_inserts,
+                    host=self.config['destination']['host'],
+                    user=self.config['destination']['user'],
+                    password=self.config['destination']['password'],
+                    database=self.config['destination']['database'],
+                    allow_local_infile=True
+                )
+                logger.info(f"Pool di {self.parallel_inserts} connessioni di destinazione creato")
+
+            # Carica i tipi di colonna di tutte le tabelle in una sola query
+            self._load_schema()
+
         except Error as e:
             logger.error(f"Errore nella connessione al database: {e}")
             self.source_conn = None  # Ensure it's set to None on failure
@@ -120,6 +277,13 @@ class DbObfuscator:
 
     def close(self):
         """Chiude le connessioni ai database"""
+        if self._dest_prepared_cursor is not None:
+            try:
+                self._dest_prepared_cursor.close()
+            except Error:
+                pass
+            self._dest_prepared_cursor = None
+
         if self.source_conn and self.source_conn.is_connected():
             self.source_conn.close()
             logger.info("Connessione al DB sorgente chiusa")
@@ -128,6 +292,38 @@ class DbObfuscator:
             self.dest_conn.close()
             logger.info("Connessione al DB destinazione chiusa")
     
+    def _load_schema(self) -> None:
+        """
+        Carica in un'unica query parametrizzata su information_schema i tipi
+        di colonna di tutte le tabelle da offuscare: una sola andata e
+        ritorno invece di uno SHOW TABLES/DESCRIBE per tabella, e i nomi
+        delle tabelle viaggiano come parametri (niente interpolazione nella
+        query, quindi niente SQL injection).
+        """
+        tables = list(self.fields_to_obfuscate)
+        if not tables:
+            return
+
+        placeholders = ', '.join(['%s'] * len(tables))
+        cursor = self.source_conn.cursor()
+        cursor.execute(
+            "SELECT table_name, column_name, data_type "
+            "FROM information_schema.columns "
+            f"WHERE table_schema = %s AND table_name IN ({placeholders})",
+            [self.config['source']['database']] + tables
+        )
+
+        self._schema = {}
+        for table_name, column_name, data_type in cursor.fetchall():
+            if isinstance(table_name, bytes):
+                table_name = table_name.decode()
+            if isinstance(column_name, bytes):
+                column_name = column_name.decode()
+            if isinstance(data_type, bytes):
+                data_type = data_type.decode()
+            self._schema.setdefault(table_name, {})[column_name] = data_type.lower()
+        cursor.close()
+
     def get_table_structure(self, table_name: str) -> Tuple[List[Dict], str]:
         """
         Ottiene la struttura della tabella dal database sorgente
@@ -135,17 +331,22 @@ class DbObfuscator:
         Returns:
             Tuple[List[Dict], str]: Lista di colonne e query per creare la tabella
         """
+        cached = self._structure_cache.get(table_name)
+        if cached is not None:
+            return cached
+
         cursor = self.source_conn.cursor(dictionary=True)
-        
+
         # Ottiene informazioni sulle colonne
         cursor.execute(f"DESCRIBE {table_name}")
         columns = cursor.fetchall()
-        
+
         # Ottiene la query CREATE TABLE
         cursor.execute(f"SHOW CREATE TABLE {table_name}")
         create_table = cursor.fetchone()['Create Table']
-        
+
         cursor.close()
+        self._structure_cache[table_name] = (columns, create_table)
         return columns, create_table
     
     def get_column_type(self, table_name: str, column_name: str) -> Optional[str]:
@@ -155,19 +356,340 @@ class DbObfuscator:
         Returns:
             Il tipo della colonna oppure None se la colonna non esiste
         """
-        cursor = self.source_conn.cursor(dictionary=True)
-        cursor.execute(f"DESCRIBE {table_name}")
-        columns = cursor.fetchall()
-        cursor.close()
-        
+        # Percorso veloce: schema già caricato da information_schema
+        # (data_type è già il tipo base, senza dimensioni tra parentesi)
+        table_schema = self._schema.get(table_name)
+        if table_schema is not None:
+            return table_schema.get(column_name)
+
+        # Riusa la struttura in cache: nessun DESCRIBE aggiuntivo per campo
+        columns, _ = self.get_table_structure(table_name)
+
         for col in columns:
             if col['Field'] == column_name:
-                # Estrae il tipo base (es. varchar(255) -> varchar)
+                # Estrae il tipo base (es. varchar(255) -> varchar) senza
+                # scomodare il motore re per un semplice prefisso
                 data_type = col['Type']
-                return re.split(r'\(|\s', data_type)[0].lower()
+                return data_type.split('(', 1)[0].split(' ', 1)[0].lower()
         
         return None  # La colonna non esiste nella tabella
     
+    def _hash_value(self, value: str) -> int:
+        """
+        Hash deterministico a 64 bit di un valore (xxh3): ~10x più veloce
+        dell'MD5 su stringhe corte e restituisce direttamente un intero,
+        senza passare dalla rappresentazione esadecimale.
+
+        Consulta prima la cache di batch popolata da _hash_many.
+
+        Args:
+            value: Stringa da hashare
+
+        Returns:
+            int: Hash a 64 bit del valore
+        """
+        cached = self._batch_hash_cache.get(value)
+        if cached is not None:
+            return cached
+        return xxhash.xxh3_64_intdigest(value.encode())
+
+    def _hash_many(self, values: List[str]) -> np.ndarray:
+        """
+        Calcola in blocco gli hash xxh3 di una lista di stringhe.
+
+        Args:
+            values: Lista di stringhe da hashare
+
+        Returns:
+            np.ndarray: Array uint64 con un hash per valore
+        """
+        return np.fromiter(
+            (xxhash.xxh3_64_intdigest(v.encode()) for v in values),
+            dtype=np.uint64, count=len(values)
+        )
+
+    @staticmethod
+    def _render_load_data_value(value: Any) -> str:
+        """
+        Serializza un valore nel formato testuale atteso da LOAD DATA INFILE:
+        \\N per i NULL ed escaping di backslash, tab e newline.
+
+        Args:
+            value: Valore della cella
+
+        Returns:
+            str: Rappresentazione testuale per il file TSV
+        """
+        if value is None:
+            return '\\N'
+        if isinstance(value, timedelta):
+            # Le colonne TIME arrivano dal connector come timedelta, ma
+            # str(timedelta) produce '1 day, 2:00:00' che MySQL non sa
+            # leggere: si rende nel formato TIME con ore cumulative e segno
+            total_us = value // timedelta(microseconds=1)
+            sign = '-' if total_us < 0 else ''
+            seconds, us = divmod(abs(total_us), 1_000_000)
+            hours, rem = divmod(seconds, 3600)
+            minutes, seconds = divmod(rem, 60)
+            s = f"{sign}{hours:02d}:{minutes:02d}:{seconds:02d}"
+            if us:
+                s += f".{us:06d}"
+            return s
+        s = value if isinstance(value, str) else str(value)
+        return (s.replace('\\', '\\\\').replace('\t', '\\t')
+                 .replace('\n', '\\n').replace('\r', '\\r'))
+
+    def _bulk_insert(self, cursor, table_name: str, fields: List[str],
+                     rows: List[Any], allow_prepared: bool = True) -> None:
+        """
+        Inserisce un batch di righe nella tabella di destinazione.
+
+        Percorso veloce: serializza il batch in un file TSV temporaneo e lo
+        carica con LOAD DATA LOCAL INFILE (un singolo messaggio di protocollo,
+        un solo parse lato server). Se il server rifiuta il local infile si
+        ripiega definitivamente su executemany.
+
+        Args:
+            cursor: Cursore sulla connessione di destinazione
+            table_name: Nome della tabella
+            fields: Nomi delle colonne nell'ordine delle righe
+            rows: Batch di righe (sequenze di valori)
+        """
+        # I valori binari (BLOB/BINARY) non sopravvivono alla serializzazione
+        # testuale + conversione di charset di LOAD DATA: quei batch passano
+        # dal fallback parametrizzato, che li trasmette intatti
+        has_binary = any(isinstance(v, (bytes, bytearray))
+                         for row in rows for v in row)
+
+        if self._use_load_data and not has_binary:
+            tmp = tempfile.NamedTemporaryFile(
+                'w', suffix='.tsv', delete=False, encoding='utf-8')
+            try:
+                for row in rows:
+                    tmp.write('\t'.join(
+                        self._render_load_data_value(v) for v in row) + '\n')
+                tmp.close()
+
+                col_list = ', '.join(f'`{f}`' for f in fields)
+                cursor.execute(
+                    f"LOAD DATA LOCAL INFILE '{tmp.name}' "
+                    f"INTO TABLE `{table_name}` "
+                    f"CHARACTER SET utf8mb4 "
+                    f"FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' "
+                    f"LINES TERMINATED BY '\\n' ({col_list})"
+                )
+                return
+            except Error as e:
+                logger.warning(f"LOAD DATA LOCAL INFILE non disponibile ({e}), fallback a executemany")
+                self._use_load_data = False
+            finally:
+                os.unlink(tmp.name)
+
+        self._multi_values_insert(cursor, table_name, fields, rows,
+                                  allow_prepared=allow_prepared)
+
+    def _multi_values_insert(self, cursor, table_name: str, fields: List[str],
+                             rows: List[Any], allow_prepared: bool = True) -> None:
+        """
+        Fallback di inserimento: un'unica INSERT multi-VALUES parametrizzata
+        per blocco (un parse/plan per migliaia di righe invece di uno per
+        riga), spezzata quando la stima in byte si avvicina al
+        max_allowed_packet di default.
+
+        Usa un cursore preparato: lo statement viene riparsato dal server
+        solo quando cambia forma (i chunk pieni sono identici tra loro) e i
+        valori viaggiano sul protocollo binario, che dimezza il payload
+        delle colonne numeriche.
+
+        Args:
+            cursor: Cursore sulla connessione di destinazione (ripiego se il
+                cursore preparato non è disponibile)
+            table_name: Nome della tabella
+            fields: Nomi delle colonne nell'ordine delle righe
+            rows: Batch di righe (sequenze di valori)
+        """
+        # Il cursore preparato condiviso è usato solo dal percorso a singolo
+        # inserter: i worker paralleli passano il cursore della propria
+        # connessione di pool (allow_prepared=False)
+        if allow_prepared:
+            if self._dest_prepared_cursor is None and self.dest_conn is not None:
+                try:
+                    self._dest_prepared_cursor = self.dest_conn.cursor(prepared=True)
+                except Error as e:
+                    logger.warning(f"Cursore preparato non disponibile: {e}")
+            if self._dest_prepared_cursor is not None:
+                cursor = self._dest_prepared_cursor
+
+        prefix = (f"INSERT INTO `{table_name}` "
+                  f"({', '.join(f'`{f}`' for f in fields)}) VALUES ")
+        row_placeholder = '(' + ', '.join(['%s'] * len(fields)) + ')'
+
+        # Il protocollo prepared di MySQL ammette al più 65535 parametri
+        # per statement: ci si tiene sotto con margine
+        max_params = 60000
+
+        pending_rows = 0
+        params = []
+        estimated_bytes = len(prefix)
+
+        for row in rows:
+            # Stima prudente della dimensione della riga renderizzata:
+            # le stringhe viaggiano in UTF-8, quindi conta i byte codificati
+            # e non i caratteri (un testo CJK occupa fino a 4 byte a carattere)
+            row_bytes = sum(
+                len(v.encode('utf-8')) if isinstance(v, str)
+                else len(v) if isinstance(v, (bytes, bytearray))
+                else 20
+                for v in row
+            ) + 3 * len(row)
+
+            if pending_rows and (estimated_bytes + row_bytes > self._max_statement_bytes
+                                 or len(params) + len(row) > max_params):
+                cursor.execute(
+                    prefix + ', '.join([row_placeholder] * pending_rows), params)
+                pending_rows = 0
+                params = []
+                estimated_bytes = len(prefix)
+
+            params.extend(row)
+            pending_rows += 1
+            estimated_bytes += row_bytes
+
+        if pending_rows:
+            cursor.execute(
+                prefix + ', '.join([row_placeholder] * pending_rows), params)
+
+    def _run_pipeline(self, fetch_fn, transform_fn, insert_fn,
+                      insert_workers: int = 1) -> int:
+        """
+        Pipeline a tre stadi su thread collegati da code limitate:
+        fetch (I/O sorgente) -> trasformazione (CPU) -> insert (I/O
+        destinazione). Gli stadi lavorano in sovrapposizione: mentre un
+        batch viene offuscato, il successivo è già in lettura e il
+        precedente in scrittura. I thread bastano perché fetch e insert
+        rilasciano il GIL durante l'I/O di rete; la trasformazione resta
+        sul thread chiamante (le cache di consistenza non sono thread-safe).
+
+        Args:
+            fetch_fn: Callable senza argomenti che restituisce il prossimo
+                batch di record (falsy a fine stream)
+            transform_fn: Callable batch -> righe pronte per l'insert
+            insert_fn: Callable che scrive un blocco di righe; con
+                insert_workers > 1 deve essere thread-safe (una connessione
+                per worker)
+            insert_workers: Numero di thread dello stadio di insert
+
+        Returns:
+            int: Numero totale di record elaborati
+        """
+        q_in = queue.Queue(maxsize=4)
+        q_out = queue.Queue(maxsize=4)
+        errors = []
+
+        def fetcher():
+            try:
+                while True:
+                    batch = fetch_fn()
+                    if not batch:
+                        break
+                    q_in.put(batch)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                q_in.put(None)
+
+        def inserter():
+            try:
+                while True:
+                    rows = q_out.get()
+                    if rows is None:
+                        break
+                    insert_fn(rows)
+            except Exception as e:
+                errors.append(e)
+                # Continua a consumare per non bloccare il produttore
+                while q_out.get() is not None:
+                    pass
+
+        t_fetch = threading.Thread(target=fetcher, name='fetcher', daemon=True)
+        t_inserters = [threading.Thread(target=inserter, name=f'inserter-{i}',
+                                        daemon=True)
+                       for i in range(insert_workers)]
+        t_fetch.start()
+        for t in t_inserters:
+            t.start()
+
+        total = 0
+        try:
+            while True:
+                batch = q_in.get()
+                if batch is None:
+                    break
+                q_out.put(transform_fn(batch))
+                total += len(batch)
+        except Exception as e:
+            errors.append(e)
+            # Svuota la coda di ingresso per sbloccare il fetcher
+            while q_in.get() is not None:
+                pass
+        finally:
+            for _ in t_inserters:
+                q_out.put(None)
+            t_fetch.join()
+            for t in t_inserters:
+                t.join()
+
+        if errors:
+            raise errors[0]
+        return total
+
+    def _begin_bulk_session(self, cursor) -> None:
+        """
+        Prepara la sessione di destinazione per il bulk load: disabilita
+        autocommit e i controlli per-riga così il flush del redo log viene
+        ammortizzato su un'unica commit a fine tabella.
+
+        Args:
+            cursor: Cursore sulla connessione di destinazione
+        """
+        cursor.execute("SET SESSION unique_checks=0")
+        cursor.execute("SET SESSION foreign_key_checks=0")
+        cursor.execute("SET SESSION autocommit=0")
+        try:
+            # Richiede privilegi SUPER: utile ma non indispensabile
+            cursor.execute("SET SESSION sql_log_bin=0")
+        except Error:
+            pass
+
+    def _end_bulk_session(self, cursor) -> None:
+        """
+        Ripristina i controlli di sessione disabilitati per il bulk load.
+
+        Args:
+            cursor: Cursore sulla connessione di destinazione
+        """
+        for stmt in ("SET SESSION unique_checks=1",
+                     "SET SESSION foreign_key_checks=1",
+                     "SET SESSION autocommit=1"):
+            try:
+                cursor.execute(stmt)
+            except Error as e:
+                logger.warning(f"Impossibile ripristinare la sessione ({stmt}): {e}")
+
+    def _cache_put(self, cache: OrderedDict, key: int, value: Any) -> None:
+        """
+        Inserisce una voce in una cache di consistenza, espellendo la voce
+        più vecchia quando la cache supera la dimensione massima.
+
+        Args:
+            cache: Cache (OrderedDict) in cui inserire
+            key: Chiave (hash a 64 bit del valore originale)
+            value: Risultato da memorizzare
+        """
+        cache[key] = value
+        if len(cache) > self.cache_max_entries:
+            cache.popitem(last=False)
+
     def obfuscate_text(self, value: str) -> str:
         """
         Offusca valori testuali preservando la punteggiatura ma modificando tutti
@@ -185,44 +707,59 @@ class DbObfuscator:
         # Converti a stringa se non lo è già
         value = str(value)
         
-        # Cache per consistenza
-        if value in self.text_cache:
-            return self.text_cache[value]
-        
-        # Genera un seed unico per questo valore usando un hash
-        hash_obj = hashlib.md5(str(value).encode())
-        seed = int(hash_obj.hexdigest(), 16)
-        
-        # Inizializza il generatore di numeri casuali con il seed
-        random.seed(seed)
-        
-        # Set di caratteri possibili per la sostituzione
-        lowercase = list('abcdefghijklmnopqrstuvwxyz')
-        uppercase = list('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
-        digits = list('0123456789')
-        all_chars = lowercase + uppercase + digits
-        
-        result = ''
+        # L'hash del valore fa sia da seed dell'offuscamento sia da chiave di cache
+        seed = self._hash_value(value)
+        cached = self.text_cache.get(seed)
+        if cached is not None:
+            return cached
+
+        # Percorso veloce: payload ASCII con loop compilato JIT (Numba)
+        if NUMBA_AVAILABLE:
+            try:
+                raw = value.encode('ascii')
+            except UnicodeEncodeError:
+                raw = None
+            if raw is not None:
+                buf = np.frombuffer(raw, dtype=np.uint8)
+                out = np.empty(len(buf), dtype=np.uint8)
+                # np.uint64: il boundary njit rifiuta gli int Python con il
+                # bit alto a 1 (OverflowError), e il digest xxh3 li produce
+                # per metà dei valori
+                _obf_ascii(buf, out, np.uint64(seed))
+                result = out.tobytes().decode('ascii')
+                self._cache_put(self.text_cache, seed, result)
+                return result
+
+        # Fallback Python puro (input non-ASCII o Numba assente):
+        # LCG inline + lookup negli alfabeti precomputati
+        state = seed & _MASK64
+        out = []
+        append = out.append
         for char in value:
-            if char.isalnum():  # Alfanumerico (lettere o cifre)
-                if char.islower():
-                    # Sostituisci con una lettera minuscola casuale
-                    result += random.choice(lowercase)
-                elif char.isupper():
-                    # Sostituisci con una lettera maiuscola casuale
-                    result += random.choice(uppercase)
-                elif char.isdigit():
-                    # Sostituisci con una cifra casuale
-                    result += random.choice(digits)
+            c = ord(char)
+            if c < 0x80:  # fast path ASCII
+                if 0x61 <= c <= 0x7a:    # a-z
+                    state = (state * _LCG_MUL + _LCG_ADD) & _MASK64
+                    append(_LOWERCASE[(state >> 33) % 26])
+                elif 0x41 <= c <= 0x5a:  # A-Z
+                    state = (state * _LCG_MUL + _LCG_ADD) & _MASK64
+                    append(_UPPERCASE[(state >> 33) % 26])
+                elif 0x30 <= c <= 0x39:  # 0-9
+                    state = (state * _LCG_MUL + _LCG_ADD) & _MASK64
+                    append(_DIGITS[(state >> 33) % 10])
                 else:
-                    # Per sicurezza, sostituisci con un carattere casuale
-                    result += random.choice(all_chars)
+                    # Preserva punteggiatura e altri caratteri non alfanumerici
+                    append(char)
+            elif char.isalnum():
+                # Alfanumerico non-ASCII: sostituisci con una minuscola
+                state = (state * _LCG_MUL + _LCG_ADD) & _MASK64
+                append(_LOWERCASE[(state >> 33) % 26])
             else:
-                # Preserva punteggiatura e altri caratteri non alfanumerici
-                result += char
-        
+                append(char)
+        result = ''.join(out)
+
         # Memorizza per uso futuro
-        self.text_cache[value] = result
+        self._cache_put(self.text_cache, seed, result)
         return result
     
     def obfuscate_date(self, value: Any) -> Any:
@@ -237,30 +774,44 @@ class DbObfuscator:
         """
         if value is None:
             return None
-        
+
+        # Percorso rapido: risultato già calcolato per questo valore, senza
+        # rifare str() né hash (la chiave include il tipo per evitare
+        # collisioni tra valori di tipo diverso che confrontano uguali)
+        result_key = (value.__class__, value)
+        try:
+            cached = self._date_result_cache.get(result_key)
+        except TypeError:
+            result_key = None
+            cached = None
+        if cached is not None:
+            return cached
+
         # Genera uno shift consistente basato sulla data originale
         str_value = str(value)
-        if str_value in self.date_shift_cache:
-            days_shift = self.date_shift_cache[str_value]
-        else:
+        key = self._hash_value(str_value)
+        days_shift = self.date_shift_cache.get(key)
+        if days_shift is None:
             # Genera shift unico per questa data (±180 giorni)
-            hash_val = int(hashlib.md5(str_value.encode()).hexdigest(), 16)
-            days_shift = (hash_val % 360) - 180
-            self.date_shift_cache[str_value] = days_shift
-        
+            days_shift = (key % 360) - 180
+            self._cache_put(self.date_shift_cache, key, days_shift)
+
         # Applica lo shift alla data originale
         if isinstance(value, datetime):
-            return value + timedelta(days=days_shift)
+            result = value + timedelta(days=days_shift)
         else:
             # Converti a datetime, applica shift, riconverti al tipo originale
             try:
                 dt = datetime.fromisoformat(str_value)
-                shifted = dt + timedelta(days=days_shift)
-                return shifted
+                result = dt + timedelta(days=days_shift)
             except:
                 # Fallback se la conversione fallisce
                 logger.warning(f"Impossibile offuscare il valore data: {value}")
                 return value
+
+        if result_key is not None:
+            self._cache_put(self._date_result_cache, result_key, result)
+        return result
     
     def obfuscate_number(self, value: Any) -> Any:
         """
@@ -274,18 +825,38 @@ class DbObfuscator:
         """
         if value is None:
             return None
-        
+
+        # Percorso rapido: risultato già calcolato per questo valore, senza
+        # rifare str() né hash (la chiave include il tipo per evitare
+        # collisioni tra valori di tipo diverso che confrontano uguali)
+        result_key = (value.__class__, value)
+        try:
+            cached_result = self._number_result_cache.get(result_key)
+        except TypeError:
+            result_key = None
+            cached_result = None
+        if cached_result is not None:
+            return cached_result
+
+        result = self._obfuscate_number_uncached(value)
+        if result_key is not None:
+            self._cache_put(self._number_result_cache, result_key, result)
+        return result
+
+    def _obfuscate_number_uncached(self, value: Any) -> Any:
+        """Calcolo effettivo di obfuscate_number, senza cache del risultato"""
         str_value = str(value)
-        
+
         # Usa fattore di trasformazione dalla cache per consistenza
-        if str_value in self.number_factor_cache:
-            factor, offset = self.number_factor_cache[str_value]
+        key = self._hash_value(str_value)
+        cached = self.number_factor_cache.get(key)
+        if cached is not None:
+            factor, offset = cached
         else:
             # Crea fattori unici per questo valore
-            hash_val = int(hashlib.md5(str_value.encode()).hexdigest(), 16)
-            factor = 0.5 + (hash_val % 1000) / 1000  # Fattore tra 0.5-1.5
-            offset = (hash_val % 100) - 50  # Offset tra -50 e 49
-            self.number_factor_cache[str_value] = (factor, offset)
+            factor = 0.5 + (key % 1000) / 1000  # Fattore tra 0.5-1.5
+            offset = (key % 100) - 50  # Offset tra -50 e 49
+            self._cache_put(self.number_factor_cache, key, (factor, offset))
         
         # Gestisce numeri interi vs decimali
         if isinstance(value, int) or '.' not in str_value:
@@ -318,7 +889,7 @@ class DbObfuscator:
             
             # Offusca parte decimale se presente
             if decimal_part:
-                decimal_hash = int(hashlib.md5((decimal_part).encode()).hexdigest(), 16)
+                decimal_hash = self._hash_value(decimal_part)
                 new_decimal = str(decimal_hash)[:len(decimal_part)]
             else:
                 new_decimal = ''
@@ -331,6 +902,222 @@ class DbObfuscator:
                 
             return result
     
+    def _server_side_eligible(self, table_name: str,
+                              field_types: Dict[str, str]) -> bool:
+        """
+        Verifica se la tabella può essere copiata interamente lato server con
+        INSERT ... SELECT, evitando il round-trip dei dati verso Python.
+
+        Condizioni: source e destination sullo stesso host (stesso server MySQL,
+        schemi diversi) e tutti i campi da offuscare di tipo numerico o data.
+        I campi testuali richiedono la logica Python carattere per carattere.
+
+        Per i campi 'date' si controlla il data_type reale della colonna:
+        la categoria include anche TIME e YEAR, su cui la DATE_ADD
+        dell'espressione SQL produce NULL o valori invalidi (il percorso
+        Python invece li restituisce inalterati).
+
+        Args:
+            table_name: Nome della tabella
+            field_types: Mappa campo -> categoria di offuscamento
+
+        Returns:
+            bool: True se la copia può avvenire lato server
+        """
+        if self.config['source']['host'] != self.config['destination']['host']:
+            return False
+        column_types = self._schema.get(table_name, {})
+        for field, category in field_types.items():
+            if category == 'number':
+                continue
+            if category == 'date':
+                if column_types.get(field) in ('date', 'datetime', 'timestamp'):
+                    continue
+            return False
+        return True
+
+    def _sql_obfuscation_expr(self, column: str, obf_type: str) -> str:
+        """
+        Costruisce l'espressione SQL che replica lato server la logica di
+        offuscamento deterministico (hash del valore -> shift/fattore).
+
+        Nota: l'hash usa i primi 8 caratteri esadecimali dell'MD5 invece
+        dell'intero digest come nella versione Python, quindi i valori
+        prodotti differiscono dal percorso Python pur restando deterministici.
+
+        Args:
+            column: Nome della colonna (già quotato dal chiamante)
+            obf_type: 'number' oppure 'date'
+
+        Returns:
+            str: Espressione SQL per la SELECT
+        """
+        col = f"`{column}`"
+        hash_expr = f"CONV(SUBSTRING(MD5({col}), 1, 8), 16, 10)"
+        if obf_type == 'number':
+            factor = f"(0.5 + ({hash_expr} % 1000) / 1000)"
+            offset = f"(({hash_expr} % 100) - 50)"
+            return f"IF({col} IS NULL, NULL, FLOOR(ABS({col} * {factor} + {offset})))"
+        else:  # date
+            shift = f"(({hash_expr} % 360) - 180)"
+            return f"IF({col} IS NULL, NULL, DATE_ADD({col}, INTERVAL {shift} DAY))"
+
+    def _process_table_server_side(self, table_name: str, columns: List[Dict],
+                                   field_types: Dict[str, str]) -> None:
+        """
+        Copia la tabella con una singola INSERT ... SELECT tra schemi sullo
+        stesso server, applicando l'offuscamento direttamente nella SELECT.
+        Nessun dato attraversa il client: il lavoro è interamente DB-bound.
+
+        Args:
+            table_name: Nome della tabella
+            columns: Struttura della tabella (output di DESCRIBE)
+            field_types: Mappa campo da offuscare -> categoria
+        """
+        source_db = self.config['source']['database']
+        dest_db = self.config['destination']['database']
+
+        select_exprs = []
+        for col in columns:
+            name = col['Field']
+            if name in field_types:
+                select_exprs.append(self._sql_obfuscation_expr(name, field_types[name]))
+            else:
+                select_exprs.append(f"`{name}`")
+
+        col_list = ', '.join(f"`{col['Field']}`" for col in columns)
+        query = (
+            f"INSERT INTO `{dest_db}`.`{table_name}` ({col_list}) "
+            f"SELECT {', '.join(select_exprs)} FROM `{source_db}`.`{table_name}`"
+        )
+
+        cursor = self.dest_conn.cursor()
+        try:
+            cursor.execute(query)
+            self.dest_conn.commit()
+            logger.info(f"Tabella {table_name}: copiati {cursor.rowcount} record lato server (INSERT ... SELECT)")
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _split_secondary_indexes(create_table_sql: str) -> Tuple[str, List[str]]:
+        """
+        Separa dalla CREATE TABLE le definizioni degli indici secondari
+        (KEY, UNIQUE KEY, FULLTEXT KEY, SPATIAL KEY) così la tabella può
+        essere creata con la sola PRIMARY KEY, caricata in bulk e indicizzata
+        alla fine: la costruzione ordinata dell'indice è molto più veloce
+        della manutenzione del B-tree riga per riga.
+
+        Le tabelle con clausole CONSTRAINT vengono lasciate intatte: le
+        foreign key dipendono dai propri indici.
+
+        Args:
+            create_table_sql: Output di SHOW CREATE TABLE
+
+        Returns:
+            Tuple[str, List[str]]: CREATE senza indici secondari e lista
+            delle clausole di indice da ricreare a fine caricamento
+        """
+        if 'CONSTRAINT' in create_table_sql:
+            return create_table_sql, []
+
+        kept = []
+        indexes = []
+        for line in create_table_sql.split('\n'):
+            stripped = line.strip()
+            if _INDEX_CLAUSE_RE.match(stripped):
+                indexes.append(stripped.rstrip(','))
+            else:
+                kept.append(line)
+
+        if not indexes:
+            return create_table_sql, []
+
+        # Rimuove l'eventuale virgola pendente sull'ultima definizione
+        # rimasta prima della parentesi di chiusura
+        for i in range(len(kept) - 1):
+            if kept[i + 1].lstrip().startswith(')') and kept[i].rstrip().endswith(','):
+                kept[i] = kept[i].rstrip()[:-1]
+
+        return '\n'.join(kept), indexes
+
+    def _rebuild_indexes(self, cursor, table_name: str,
+                         indexes: List[str]) -> None:
+        """
+        Ricrea in un'unica ALTER TABLE gli indici secondari posticipati
+        (MySQL li costruisce in un solo passaggio di rebuild).
+
+        Args:
+            cursor: Cursore sulla connessione di destinazione
+            table_name: Nome della tabella
+            indexes: Clausole di indice estratte dalla CREATE TABLE
+        """
+        if not indexes:
+            return
+        logger.info(f"Ricostruzione di {len(indexes)} indici sulla tabella {table_name}")
+        cursor.execute(f"ALTER TABLE `{table_name}` "
+                       + ', '.join(f"ADD {idx}" for idx in indexes))
+        self.dest_conn.commit()
+
+    def obfuscate_number_column(self, values: List[Any]) -> List[Any]:
+        """
+        Offusca in blocco un'intera colonna numerica.
+
+        Gli interi non negativi (entro i 53 bit rappresentabili senza perdita
+        in float64) passano dal percorso vettoriale NumPy: hash in blocco,
+        fattore/offset e troncamento delle cifre in eccesso calcolati su
+        interi array. None, decimali e negativi usano il percorso scalare.
+
+        Args:
+            values: Valori della colonna per il batch corrente
+
+        Returns:
+            List[Any]: Valori offuscati, nello stesso ordine
+        """
+        result = list(values)
+        vector_idx = [i for i, v in enumerate(values)
+                      if isinstance(v, int) and not isinstance(v, bool)
+                      and 0 <= v < (1 << 53)]
+
+        if vector_idx:
+            vals = np.array([values[i] for i in vector_idx], dtype=np.float64)
+            hashes = self._hash_many([str(values[i]) for i in vector_idx])
+            factor = 0.5 + (hashes % 1000) / 1000.0  # Fattore tra 0.5-1.5
+            offset = (hashes % 100).astype(np.int64) - 50  # Offset tra -50 e 49
+            new = np.abs(vals * factor + offset).astype(np.int64)
+
+            # Mantiene lo stesso numero di cifre troncando quelle in eccesso
+            # (il padding con zeri del percorso scalare è numericamente nullo)
+            safe_vals = np.maximum(vals, 1)
+            safe_new = np.maximum(new, 1).astype(np.float64)
+            nd_orig = (np.floor(np.log10(safe_vals)) + 1).astype(np.int64)
+            nd_new = (np.floor(np.log10(safe_new)) + 1).astype(np.int64)
+            excess = np.maximum(nd_new - nd_orig, 0)
+            new = new // np.power(10, excess)
+
+            for i, v in zip(vector_idx, new.tolist()):
+                result[i] = v
+
+        vector_set = set(vector_idx)
+        for i, value in enumerate(values):
+            if i not in vector_set:
+                result[i] = self.obfuscate_number(value)
+        return result
+
+    def obfuscate_date_column(self, values: List[Any]) -> List[Any]:
+        """
+        Offusca in blocco un'intera colonna di date. L'hashing è già
+        ammortizzato dal pre-calcolo di batch (_hash_many); lo shift con
+        timedelta resta per-oggetto perché opera su datetime Python.
+
+        Args:
+            values: Valori della colonna per il batch corrente
+
+        Returns:
+            List[Any]: Date offuscate, nello stesso ordine
+        """
+        return [self.obfuscate_date(v) for v in values]
+
     def table_exists(self, table_name: str) -> bool:
         """
         Verifica se una tabella esiste nel database di origine
@@ -341,9 +1128,14 @@ class DbObfuscator:
         Returns:
             bool: True se la tabella esiste, False altrimenti
         """
+        # Percorso veloce: schema già caricato da information_schema
+        if table_name in self._schema:
+            return True
+
         try:
+            # Fallback parametrizzato per tabelle fuori dallo schema pre-caricato
             cursor = self.source_conn.cursor()
-            cursor.execute(f"SHOW TABLES LIKE '{table_name}'")
+            cursor.execute("SHOW TABLES LIKE %s", (table_name,))
             result = cursor.fetchone()
             cursor.close()
             return result is not None
@@ -370,110 +1162,203 @@ class DbObfuscator:
             logger.error(f"Impossibile elaborare la tabella '{table_name}' perché la connessione al database di destinazione non è valida.")
             return
 
-        source_cursor = self.source_conn.cursor(dictionary=True)
+        # Cursore non bufferizzato: i record vengono letti in streaming a
+        # blocchi di batch_size invece di materializzare l'intera tabella
+        source_cursor = self.source_conn.cursor(dictionary=True, buffered=False)
         dest_cursor = self.dest_conn.cursor()
 
+        # Coppie (connessione, cursore) prese dal pool dai worker di insert
+        pool_contexts = []
+
         try:
-            # Ottiene struttura tabella
+            # Ottiene struttura tabella; gli indici secondari vengono
+            # scorporati e ricostruiti a caricamento concluso
             columns, create_table_sql = self.get_table_structure(table_name)
+            create_sql, deferred_indexes = self._split_secondary_indexes(create_table_sql)
+
             # Elimina tabella destinazione se esiste
             dest_cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
-            dest_cursor.execute(create_table_sql)
+            dest_cursor.execute(create_sql)
             self.dest_conn.commit()
-            logger.info(f"Tabella {table_name} ricreata nel database destinazione")
-            
-            # Ottiene tutti i record
-            source_cursor.execute(f"SELECT * FROM {table_name}")
-            records = source_cursor.fetchall()
-            logger.info(f"Trovati {len(records)} record nella tabella {table_name}")
-            
-            # Ottiene lista campi da offuscare per questa tabella
+            logger.info(f"Tabella {table_name} ricreata nel database destinazione"
+                        + (f" ({len(deferred_indexes)} indici posticipati)"
+                           if deferred_indexes else ""))
+
+            # Bulk load: una sola commit a fine tabella invece che per batch
+            self._begin_bulk_session(dest_cursor)
+
+            # Ottiene lista campi da offuscare per questa tabella.
+            # I tipi vanno determinati prima della SELECT in streaming:
+            # con il cursore non bufferizzato la connessione sorgente non
+            # può eseguire altre query finché ci sono risultati pendenti
             fields_to_obfuscate = self.fields_to_obfuscate.get(table_name, [])
-            
+            field_types = {}
+
+            for field in fields_to_obfuscate:
+                data_type = self.get_column_type(table_name, field)
+
+                if data_type is None:
+                    logger.warning(f"ATTENZIONE: Campo '{field}' non trovato nella tabella '{table_name}'. Questo campo verrà ignorato.")
+                    continue
+
+                obfuscation_type = self.type_mapping.get(data_type, 'text')
+                field_types[field] = obfuscation_type
+                logger.info(f"Campo {field}: tipo {data_type} -> offuscamento {obfuscation_type}")
+
+            # Aggiorna la lista dei campi da offuscare con solo quelli validi
+            fields_to_obfuscate = list(field_types)
+
+            # Se tutti i campi sono numerici/date e i DB sono sullo stesso host,
+            # la copia avviene interamente lato server senza round-trip in Python
+            if field_types and self._server_side_eligible(table_name, field_types):
+                # La INSERT ... SELECT gira sulla connessione di destinazione
+                # e richiede che quell'utente abbia SELECT sullo schema
+                # sorgente: se i grant non bastano si ripiega sul percorso
+                # Python (la SELECT in streaming non è ancora partita)
+                try:
+                    logger.info(f"Tabella {table_name}: offuscamento interamente lato server")
+                    self._process_table_server_side(table_name, columns, field_types)
+                    self._rebuild_indexes(dest_cursor, table_name, deferred_indexes)
+                    logger.info(f"Tabella {table_name} elaborata con successo")
+                    return
+                except Error as e:
+                    self.dest_conn.rollback()
+                    logger.warning(f"Copia lato server non riuscita per la tabella {table_name} ({e}), si procede con il percorso Python")
+
+            # Esegue la SELECT in streaming: il primo batch è disponibile
+            # subito e la memoria resta O(batch_size) invece di O(tabella)
+            source_cursor.execute(f"SELECT * FROM {table_name}")
+            fields = list(source_cursor.column_names)
+            batch_size = int(self.config.get('batch_size', 10000))
+
+            progress = {'count': 0}
+            progress_lock = threading.Lock()
+
+            if self._dest_pool is not None:
+                # Stadio di insert parallelo: ogni worker prende una
+                # connessione dal pool al primo batch e la tiene fino a
+                # fine tabella (commit congiunto alla fine)
+                tlocal = threading.local()
+                insert_workers = self.parallel_inserts
+
+                def insert_rows(rows):
+                    ctx = getattr(tlocal, 'ctx', None)
+                    if ctx is None:
+                        conn = self._dest_pool.get_connection()
+                        cur = conn.cursor()
+                        self._begin_bulk_session(cur)
+                        ctx = (conn, cur)
+                        tlocal.ctx = ctx
+                        with progress_lock:
+                            pool_contexts.append(ctx)
+                    self._bulk_insert(ctx[1], table_name, fields, rows,
+                                      allow_prepared=False)
+                    with progress_lock:
+                        progress['count'] += len(rows)
+                        count = progress['count']
+                    logger.info(f"Elaborati {count} record nella tabella {table_name}")
+            else:
+                insert_workers = 1
+
+                def insert_rows(rows):
+                    self._bulk_insert(dest_cursor, table_name, fields, rows)
+                    progress['count'] += len(rows)
+                    logger.info(f"Elaborati {progress['count']} record nella tabella {table_name}")
+
             if not fields_to_obfuscate:
                 # Se nessun campo deve essere offuscato, copia direttamente
                 logger.info(f"Nessun campo da offuscare nella tabella {table_name}, copia diretta")
-                # Costruisci istruzione INSERT con tutti i campi
-                if records:
-                    fields = list(records[0].keys())
-                    placeholders = ', '.join(['%s'] * len(fields))
-                    insert_query = f"INSERT INTO `{table_name}` ({', '.join([f'`{f}`' for f in fields])}) VALUES ({placeholders})"
-
-                    # Prepara i valori (in batch per efficienza)
-                    batch_size = 1000
-                    for i in range(0, len(records), batch_size):
-                        batch = records[i:i+batch_size]
-                        values = [[record[field] for field in fields] for record in batch]
-                        dest_cursor.executemany(insert_query, values)
-                        self.dest_conn.commit()
-                        logger.info(f"Copiati {min(i+batch_size, len(records))}/{len(records)} record nella tabella {table_name}")
+
+                self._run_pipeline(
+                    lambda: source_cursor.fetchmany(batch_size),
+                    lambda batch: [tuple(record.values()) for record in batch],
+                    insert_rows,
+                    insert_workers=insert_workers,
+                )
             else:
-                # Determina tipo di dato per ciascun campo da offuscare
-                field_types = {}
-                valid_fields = []
-                
-                for field in fields_to_obfuscate:
-                    data_type = self.get_column_type(table_name, field)
-                    
-                    if data_type is None:
-                        logger.warning(f"ATTENZIONE: Campo '{field}' non trovato nella tabella '{table_name}'. Questo campo verrà ignorato.")
-                        continue
-                    
-                    valid_fields.append(field)
-                    obfuscation_type = self.type_mapping.get(data_type, 'text')
-                    field_types[field] = obfuscation_type
-                    logger.info(f"Campo {field}: tipo {data_type} -> offuscamento {obfuscation_type}")
-                
-                # Aggiorna la lista dei campi da offuscare con solo quelli validi
-                fields_to_obfuscate = valid_fields
-                
-                # Elabora record per record
-                if records:
-                    fields = list(records[0].keys())
-                    placeholders = ', '.join(['%s'] * len(fields))
-                    insert_query = f"INSERT INTO `{table_name}` ({', '.join([f'`{f}`' for f in fields])}) VALUES ({placeholders})"
-
-                    # Batch processing
-                    batch_size = 1000
-                    total_processed = 0
-                    
-                    for i in range(0, len(records), batch_size):
-                        batch = records[i:i+batch_size]
-                        values_batch = []
-                        
-                        for record in batch:
-                            # Crea copia del record
-                            new_record = list(record.values())
-
-                            # Offusca i campi necessari
-                            for idx, field in enumerate(fields):
-                                if field in fields_to_obfuscate:
-                                    obf_type = field_types[field]
-                                    value = new_record[idx]
-
-                                    if obf_type == 'text':
-                                        new_record[idx] = self.obfuscate_text(value)
-                                    elif obf_type == 'date':
-                                        new_record[idx] = self.obfuscate_date(value)
-                                    elif obf_type == 'number':
-                                        new_record[idx] = self.obfuscate_number(value)
-
-                            values_batch.append(tuple(new_record))
-
-                        # Esegue inserimento batch con parameterized query
-                        dest_cursor.executemany(insert_query, values_batch)
-                        self.dest_conn.commit()
-
-                        total_processed += len(batch)
-                        logger.info(f"Elaborati {total_processed}/{len(records)} record nella tabella {table_name}")
+                # Dispatch pre-calcolato una volta per tabella: coppie
+                # (indice colonna, funzione di offuscamento), così il loop
+                # per-riga non paga membership test né confronti di stringhe.
+                # Le colonne numeriche/date vengono offuscate in blocco
+                # (percorso vettoriale NumPy), il testo riga per riga
+                column_obfuscators = {
+                    'date': self.obfuscate_date_column,
+                    'number': self.obfuscate_number_column,
+                }
+                scalar_ops = [(idx, self.obfuscate_text)
+                              for idx, field in enumerate(fields)
+                              if field_types.get(field) == 'text']
+                column_ops = [(idx, column_obfuscators[field_types[field]])
+                              for idx, field in enumerate(fields)
+                              if field_types.get(field) in ('date', 'number')]
+
+                def obfuscate_batch(batch):
+                    # Pre-calcola in blocco gli hash dei valori da offuscare:
+                    # il costo di hashing è ammortizzato fuori dal loop per-riga
+                    batch_strings = list({
+                        str(record[f]) for record in batch
+                        for f in fields_to_obfuscate
+                        if record[f] is not None and record[f] != ''
+                    })
+                    self._batch_hash_cache = dict(
+                        zip(batch_strings, self._hash_many(batch_strings).tolist())
+                    )
+
+                    # Layout colonnare (SoA): il batch viene trasposto una
+                    # volta, le colonne si trasformano in blocco e le righe
+                    # vengono rizippate in tuple solo alla fine — niente
+                    # liste per-riga da allocare e mutare
+                    columns_data = list(zip(*(record.values() for record in batch)))
+
+                    # Colonne numeriche/date: trasformazione vettoriale in blocco
+                    for idx, column_fn in column_ops:
+                        columns_data[idx] = column_fn(list(columns_data[idx]))
+
+                    # Colonne testuali: offuscamento valore per valore
+                    for idx, fn in scalar_ops:
+                        columns_data[idx] = [fn(v) for v in columns_data[idx]]
+
+                    return list(zip(*columns_data))
+
+                # Pipeline fetch -> offuscamento -> insert in sovrapposizione
+                self._run_pipeline(
+                    lambda: source_cursor.fetchmany(batch_size),
+                    obfuscate_batch,
+                    insert_rows,
+                    insert_workers=insert_workers,
+                )
 
+            # Unica commit per l'intera tabella (anche sulle connessioni
+            # di pool usate dai worker di insert)
+            self.dest_conn.commit()
+            for conn, _ in pool_contexts:
+                conn.commit()
+
+            # Ricrea gli indici secondari in un solo passaggio di rebuild
+            self._rebuild_indexes(dest_cursor, table_name, deferred_indexes)
             logger.info(f"Tabella {table_name} elaborata con successo")
 
         except Error as e:
             self.dest_conn.rollback()
+            for conn, _ in pool_contexts:
+                try:
+                    conn.rollback()
+                except Error:
+                    pass
             logger.error(f"Errore nell'elaborazione della tabella {table_name}: {e}")
             raise
         finally:
+            try:
+                self._end_bulk_session(dest_cursor)
+            except Exception:
+                pass
+            for conn, cur in pool_contexts:
+                try:
+                    self._end_bulk_session(cur)
+                    cur.close()
+                    conn.close()  # restituisce la connessione al pool
+                except Exception:
+                    pass
             source_cursor.close()
             dest_cursor.close()
     
@@ -488,28 +1373,53 @@ class DbObfuscator:
         
         try:
             self.connect()
-            
-            # Processa ogni tabella specificata nel file di configurazione
+
+            # Valida le tabelle specificate nel file di configurazione
+            tables_to_process = []
             for table in self.fields_to_obfuscate.keys():
-                if table not in tables_processed and table not in tables_skipped:
-                    # Verifica se la tabella esiste
-                    if not self.table_exists(table):
-                        logger.warning(f"Tabella '{table}' non trovata nel database di origine. Verrà ignorata.")
-                        tables_skipped.append(table)
-                        continue
-                    
-                    # Verifica quali campi esistono nella tabella
-                    fields = self.fields_to_obfuscate.get(table, [])
-                    invalid_fields = []
-                    
-                    for field in fields:
-                        if self.get_column_type(table, field) is None:
-                            invalid_fields.append(field)
-                    
-                    if invalid_fields:
-                        fields_skipped[table] = invalid_fields
-                    
-                    # Processa la tabella
+                if table in tables_to_process or table in tables_skipped:
+                    continue
+
+                # Verifica se la tabella esiste
+                if not self.table_exists(table):
+                    logger.warning(f"Tabella '{table}' non trovata nel database di origine. Verrà ignorata.")
+                    tables_skipped.append(table)
+                    continue
+
+                # Verifica quali campi esistono nella tabella
+                fields = self.fields_to_obfuscate.get(table, [])
+                invalid_fields = []
+
+                for field in fields:
+                    if self.get_column_type(table, field) is None:
+                        invalid_fields.append(field)
+
+                if invalid_fields:
+                    fields_skipped[table] = invalid_fields
+
+                tables_to_process.append(table)
+
+            # Le tabelle sono indipendenti tra loro: con parallel_tables > 1
+            # vengono elaborate da un pool di processi, ognuno con la propria
+            # coppia di connessioni (l'offuscamento è CPU-bound, quindi
+            # processi e non thread per aggirare il GIL)
+            max_workers = int(self.config.get('parallel_tables', 1))
+
+            if max_workers > 1 and len(tables_to_process) > 1:
+                logger.info(f"Elaborazione parallela di {len(tables_to_process)} tabelle con {max_workers} processi")
+                with ProcessPoolExecutor(
+                        max_workers=max_workers,
+                        initializer=_init_table_worker,
+                        initargs=(self.config_file, self.fields_file)) as executor:
+                    futures = {
+                        executor.submit(_process_table_worker, table): table
+                        for table in tables_to_process
+                    }
+                    for future in as_completed(futures):
+                        future.result()
+                        tables_processed.append(futures[future])
+            else:
+                for table in tables_to_process:
                     self.process_table(table)
                     tables_processed.append(table)
             
@@ -547,6 +1457,42 @@ class DbObfuscator:
             self.close()
 
 
+# Istanza per-processo dei worker del pool: creata una volta sola
+# dall'initializer e riusata per tutte le tabelle assegnate al processo
+_worker_obfuscator = None
+
+
+def _init_table_worker(config_file: str, fields_file: str) -> None:
+    """
+    Initializer del pool di processi: crea il DbObfuscator del worker e apre
+    la sua coppia di connessioni una volta per processo (gli argomenti devono
+    essere picklabili, quindi si passano i path dei file di configurazione).
+
+    Args:
+        config_file: Path del file di configurazione YAML
+        fields_file: Path del file con i campi da offuscare
+    """
+    global _worker_obfuscator
+    _worker_obfuscator = DbObfuscator(config_file, fields_file)
+    _worker_obfuscator.connect()
+    atexit.register(_worker_obfuscator.close)
+
+
+def _process_table_worker(table_name: str) -> str:
+    """
+    Worker per l'elaborazione parallela: elabora una tabella riusando
+    l'istanza e le connessioni del processo create da _init_table_worker.
+
+    Args:
+        table_name: Nome della tabella da elaborare
+
+    Returns:
+        str: Nome della tabella elaborata
+    """
+    _worker_obfuscator.process_table(table_name)
+    return table_name
+
+
 def main():
     """Funzione principale"""
     try: